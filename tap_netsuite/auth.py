@@ -2,16 +2,49 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlencode
+
 import requests
+from requests.adapters import HTTPAdapter
 from singer_sdk.authenticators import OAuthAuthenticator, SingletonMeta
 from singer_sdk.helpers._util import utc_now
 
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    from cached_property import cached_property
+
+# Cached tokens are only reused while they have at least this many seconds left.
+TOKEN_CACHE_BUFFER = 300
+# Netsuite access tokens are valid for 60 minutes; cached ones never get longer.
+TOKEN_MAX_LIFETIME = 3600
+TOKEN_MAX_ATTEMPTS = 3
+TOKEN_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 
 # The SingletonMeta metaclass makes your streams reuse the same authenticator instance.
 # If this behaviour interferes with your use-case, you can remove the metaclass.
 class NetsuiteAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
     """Authenticator class for Netsuite."""
 
+    # Shared across refreshes so the token endpoint connection is kept alive.
+    _session = requests.Session()
+    _session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    # Streams fetch records from several threads; only one of them may refresh.
+    _refresh_lock = threading.RLock()
+    # The access token last loaded from the on-disk cache, if any.
+    _reused_token: str | None = None
+
     @property
     def oauth_request_body(self) -> dict:
         """Define the OAuth request body for the Netsuite API.
@@ -24,6 +57,25 @@ class NetsuiteAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
             'grant_type': 'refresh_token',
         }
 
+    @cached_property
+    def _encoded_request_body(self) -> str:
+        """Return the form-encoded OAuth request body, built once.
+
+        Returns:
+            The URL-encoded request body.
+        """
+        return urlencode(self.oauth_request_payload)
+
+    @property
+    def auth_headers(self) -> dict:
+        """Return the auth headers, refreshing the token at most once at a time.
+
+        Returns:
+            HTTP headers for authentication.
+        """
+        with self._refresh_lock:
+            return super().auth_headers
+
     @classmethod
     def create_for_stream(cls, stream) -> "NetsuiteAuthenticator":
         """Instantiate an authenticator for a specific Singer stream.
@@ -38,21 +90,198 @@ class NetsuiteAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
             stream=stream,
         )
 
+    @property
+    def token_cache_path(self) -> Path:
+        """Return the on-disk location of the cached access token.
+
+        The file lives in the user's cache directory. Its name is a hash of the
+        account and of every credential, so a different client, secret or
+        refresh token (i.e. another user or role) never reuses the token.
+
+        Returns:
+            A path in the per-user cache directory.
+        """
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        credentials = "\0".join(
+            self.config[key]
+            for key in (
+                "account_identifier",
+                "client_id",
+                "client_secret",
+                "refresh_token",
+            )
+        )
+        key = hashlib.sha256(credentials.encode()).hexdigest()[:32]
+        return Path(cache_home) / "tap-netsuite" / f"token-{key}.json"
+
+    @property
+    def cache_access_token(self) -> bool:
+        """Return whether access tokens are cached on disk between runs.
+
+        Returns:
+            The `cache_access_token` setting, off by default.
+        """
+        return bool(self.config.get("cache_access_token"))
+
+    def is_token_valid(self) -> bool:
+        """Check if token is valid, falling back to the on-disk token cache.
+
+        Returns:
+            True if the token is valid (fresh).
+        """
+        if super().is_token_valid():
+            return True
+        return self.cache_access_token and self._load_cached_token()
+
+    def _load_cached_token(self) -> bool:
+        """Load a still-fresh access token left behind by a previous run.
+
+        Files owned by another user are ignored, and no cached token is trusted
+        for longer than Netsuite's token lifetime.
+
+        Returns:
+            True if a usable token was loaded.
+        """
+        path = self.token_cache_path
+        try:
+            if hasattr(os, "getuid") and path.stat().st_uid != os.getuid():
+                self.logger.warning(
+                    f"Ignoring OAuth token cache owned by another user: {path}"
+                )
+                return False
+            cached = json.loads(path.read_text())
+            access_token = cached["access_token"]
+            expires_in = min(int(cached["expires_in"]), TOKEN_MAX_LIFETIME)
+            last_refreshed = datetime.fromisoformat(cached["last_refreshed"])
+            elapsed = (utc_now() - last_refreshed).total_seconds()
+        except (OSError, KeyError, TypeError, ValueError):
+            return False
+        if elapsed < 0 or expires_in - elapsed <= TOKEN_CACHE_BUFFER:
+            return False
+        self.access_token = access_token
+        self.expires_in = expires_in
+        self.last_refreshed = last_refreshed
+        self._reused_token = access_token
+        self.logger.info("Reusing cached OAuth access token.")
+        return True
+
+    def clear_cached_token(self) -> None:
+        """Forget the current access token, in memory and on disk.
+
+        Called when Netsuite rejects the token, so that the next request and
+        later runs request a new one instead of reusing it until it expires.
+        """
+        with self._refresh_lock:
+            self.access_token = None
+            self.last_refreshed = None
+            try:
+                self.token_cache_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as ex:
+                self.logger.warning(f"Could not remove OAuth token cache: {ex}")
+
+    def discard_rejected_token(self, request: requests.PreparedRequest) -> bool:
+        """Forget the access token a request was rejected with.
+
+        Args:
+            request: The request Netsuite answered with 401.
+
+        Returns:
+            True if the rejected token had been reused from the cache, in which
+            case the request may be retried once with a new token.
+        """
+        rejected = request.headers.get("Authorization")
+        with self._refresh_lock:
+            if rejected == f"Bearer {self.access_token}":
+                self.clear_cached_token()
+            return (
+                self._reused_token is not None
+                and rejected == f"Bearer {self._reused_token}"
+            )
+
+    def _store_cached_token(self) -> None:
+        """Atomically write the current access token to the token cache."""
+        path = self.token_cache_path
+        payload = json.dumps({
+            "access_token": self.access_token,
+            "expires_in": self.expires_in,
+            "last_refreshed": self.last_refreshed.isoformat(),
+        })
+        tmp_path = None
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file with 0600 permissions.
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}")
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            self.logger.warning(f"Could not write OAuth token cache: {ex}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _token_retry_delay(
+        attempt: int,
+        response: requests.Response | None = None,
+    ) -> float:
+        """Return how long to wait before retrying the token request.
+
+        Args:
+            attempt: The number of the attempt that just failed, starting at 1.
+            response: The failed response, if one was received.
+
+        Returns:
+            The `Retry-After` value when given, otherwise an exponential backoff
+            with jitter.
+        """
+        if response is not None:
+            try:
+                return float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                pass
+        return min(30.0, 2.0 ** (attempt - 1)) * (1 + random.uniform(0, 0.5))
+
     # Authentication and refresh
     def update_access_token(self) -> None:
         """Update `access_token` along with: `last_refreshed` and `expires_in`.
 
         Raises:
             RuntimeError: When OAuth login fails.
+            requests.RequestException: When the token endpoint stays unreachable.
         """
         request_time = utc_now()
-        auth_request_payload = self.oauth_request_payload
-        token_response = requests.post(
-            "https://{account_identifier}.suitetalk.api.netsuite.com/services/rest/auth/oauth2/v1/token".format(account_identifier=self.config["account_identifier"]),
-            data=auth_request_payload,
-            timeout=60,
-            auth=(self.config["client_id"], self.config["client_secret"])
-        )
+        for attempt in range(1, TOKEN_MAX_ATTEMPTS + 1):
+            try:
+                token_response = self._session.post(
+                    "https://{account_identifier}.suitetalk.api.netsuite.com/services/rest/auth/oauth2/v1/token".format(account_identifier=self.config["account_identifier"]),
+                    data=self._encoded_request_body,
+                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                    timeout=60,
+                    auth=(self.config["client_id"], self.config["client_secret"])
+                )
+            except (requests.ConnectionError, requests.Timeout) as ex:
+                if attempt == TOKEN_MAX_ATTEMPTS:
+                    raise
+                delay = self._token_retry_delay(attempt)
+                self.logger.warning(
+                    f"OAuth request failed ({ex}), retrying in {delay:.1f}s."
+                )
+                time.sleep(delay)
+                continue
+            if (
+                token_response.status_code not in TOKEN_RETRY_STATUSES
+                or attempt == TOKEN_MAX_ATTEMPTS
+            ):
+                break
+            delay = self._token_retry_delay(attempt, token_response)
+            self.logger.warning(
+                f"OAuth request returned {token_response.status_code}, "
+                f"retrying in {delay:.1f}s."
+            )
+            time.sleep(delay)
+
         try:
             token_response.raise_for_status()
         except requests.HTTPError as ex:
@@ -72,3 +301,5 @@ class NetsuiteAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
                 "expires.",
             )
         self.last_refreshed = request_time
+        if self.expires_in and self.cache_access_token:
+            self._store_cached_token()
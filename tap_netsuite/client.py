@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
+from decimal import Decimal
 from http import HTTPStatus
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from singer_sdk import _singerlib as singer
 from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
 from singer_sdk.streams import RESTStream
 
@@ -20,6 +26,53 @@ else:
 _Auth = Callable[[requests.PreparedRequest], requests.PreparedRequest]
 
 
+def _write_message_line(line: bytes) -> None:
+    """Write a serialized Singer message line to stdout.
+
+    Writes go to the binary buffer when there is one. The SDK flushes the text
+    layer after each of its own messages, so ordering with them is kept.
+
+    Args:
+        line: The serialized message, including its trailing newline.
+    """
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is None:
+        sys.stdout.write(line.decode())
+    else:
+        stdout_buffer.write(line)
+
+
+# Connections the shared pool keeps per host, and so the most requests that can
+# run concurrently without opening (and TLS-handshaking) throwaway connections.
+MAX_POOL_CONNECTIONS = 32
+
+# Every stream talks to the same account host, so share one keep-alive pool.
+# Failed requests are retried only by the SDK's backoff (see `request_decorator`),
+# so every attempt goes through `_request` and `validate_response`.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=MAX_POOL_CONNECTIONS),
+)
+
+
+def _orjson_default(value: Any) -> str:
+    """Encode values orjson doesn't support natively, as the SDK does.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The string form of the value.
+
+    Raises:
+        TypeError: For decimals, which the SDK writes as exact JSON numbers.
+    """
+    if isinstance(value, Decimal):
+        raise TypeError("Decimal is written by the SDK")
+    return str(value)
+
+
 class NetsuiteStream(RESTStream):
     """Netsuite stream class."""
 
@@ -28,22 +81,44 @@ class NetsuiteStream(RESTStream):
         """Return the API URL root, configurable via tap settings."""
         return "https://{account_identifier}.suitetalk.api.netsuite.com/services/rest/record/v1".format(account_identifier=self.config["account_identifier"])
 
-    records_jsonpath = "$"  # Or override `parse_response`.
     next_page_token_jsonpath = "$.next_page"  # Or override `get_next_page_token`.
     custom_attribute_prefix = None
+    # Top-level fields to request from record endpoints; None requests them all.
+    fields: list[str] | None = None
 
-    @cached_property
+    # Netsuite auth is per account, so every stream shares one authenticator.
+    _shared_authenticator: _Auth | None = None
+
+    # Set when Netsuite throttles a request. Requests from every stream and
+    # thread then wait until it, and go out one at a time until one succeeds.
+    _rate_limit_lock = threading.RLock()
+    _rate_limited_until = 0.0
+
+    @property
     def authenticator(self) -> _Auth:
-        """Return a new authenticator object.
+        """Return the authenticator shared by all Netsuite streams.
 
         Returns:
             An authenticator instance.
         """
-        return NetsuiteAuthenticator.create_for_stream(self)
+        if NetsuiteStream._shared_authenticator is None:
+            NetsuiteStream._shared_authenticator = (
+                NetsuiteAuthenticator.create_for_stream(self)
+            )
+        return NetsuiteStream._shared_authenticator
 
     @property
+    def requests_session(self) -> requests.Session:
+        """Return the HTTP session shared by all Netsuite streams.
+
+        Returns:
+            The shared `requests.Session` object.
+        """
+        return _HTTP_SESSION
+
+    @cached_property
     def http_headers(self) -> dict:
-        """Return the http headers needed.
+        """Return the http headers needed, built once per stream.
 
         Returns:
             A dictionary of HTTP headers.
@@ -69,6 +144,8 @@ class NetsuiteStream(RESTStream):
         Returns:
             A dictionary of URL query parameters.
         """
+        if self.fields:
+            return {"fields": ",".join(self.fields)}
         return {}
 
     def get_next_page_token(
@@ -87,6 +164,71 @@ class NetsuiteStream(RESTStream):
         """
         return None
 
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: dict | None,
+    ) -> requests.Response:
+        """Send a request, first waiting out any rate limiting.
+
+        This runs for every attempt, including the SDK's backoff retries. While
+        Netsuite is rate limiting, each request is sent alone, holding the lock,
+        so that the others only follow once one succeeds. A request throttled
+        again renews the wait in `validate_response`.
+
+        Args:
+            prepared_request: The request to send.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The validated response.
+        """
+        with NetsuiteStream._rate_limit_lock:
+            if NetsuiteStream._rate_limited_until:
+                delay = NetsuiteStream._rate_limited_until - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                response = super()._request(prepared_request, context)
+                NetsuiteStream._rate_limited_until = 0.0
+                return response
+        return super()._request(prepared_request, context)
+
+    @staticmethod
+    def _decode_response(response: requests.Response) -> Any:
+        """Decode a response body, reusing the result on later calls.
+
+        Both `parse_response` and `get_next_page_token` read every page, so the
+        decoded body is cached on the response object.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+
+        Returns:
+            The decoded JSON body.
+        """
+        decoded = getattr(response, "_netsuite_json", None)
+        if decoded is None:
+            decoded = orjson.loads(response.content)
+            response._netsuite_json = decoded  # type: ignore[attr-defined]
+        return decoded
+
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records.
+
+        Record endpoints return a single record as the whole response body.
+        Records not found (400, see `validate_response`) yield nothing, without
+        decoding the error body.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+
+        Yields:
+            The record found in the response.
+        """
+        if response.status_code == 400:
+            return
+        yield self._decode_response(response)
+
     def validate_response(self, response: requests.Response) -> None:
         """Validate HTTP response.
 
@@ -122,6 +264,27 @@ class NetsuiteStream(RESTStream):
             ### Dealing with records not found
             return
 
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1.0
+            with NetsuiteStream._rate_limit_lock:
+                NetsuiteStream._rate_limited_until = max(
+                    NetsuiteStream._rate_limited_until,
+                    time.monotonic() + retry_after,
+                )
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            # The token may have been revoked: forget it. A token reused from the
+            # cache gets one retry, with the request re-authenticated.
+            authenticator = NetsuiteStream._shared_authenticator
+            if isinstance(authenticator, NetsuiteAuthenticator):
+                if authenticator.discard_rejected_token(response.request):
+                    authenticator(response.request)
+                    msg = self.response_error_message(response)
+                    raise RetriableAPIError(msg, response)
+
         if (
             response.status_code in self.extra_retry_statuses
             or HTTPStatus.INTERNAL_SERVER_ERROR
@@ -161,6 +324,35 @@ class NetsuiteStream(RESTStream):
         Returns:
             The resulting record dict, or `None` if the record should be excluded.
         """
-        if self.custom_attribute_prefix:
-            row[self.custom_attribute_prefix] = [{k: v} for k, v in row.items() if k.startswith(self.custom_attribute_prefix)]
+        prefix = self.custom_attribute_prefix
+        if prefix:
+            prefix_length = len(prefix)
+            row[prefix] = [
+                {k: v} for k, v in row.items() if k[:prefix_length] == prefix
+            ]
         return row
+
+    def _write_record_message(self, record: dict) -> None:
+        """Write out RECORD messages, serialized with orjson.
+
+        Matches the SDK's output, except for whitespace, including the string
+        form of `time_extracted`. Messages orjson can't encode the way the SDK
+        does, i.e. with decimals or integers wider than 64 bits, are written by
+        the SDK instead.
+
+        Args:
+            record: A single stream record.
+        """
+        for record_message in self._generate_record_messages(record):
+            try:
+                line = orjson.dumps(
+                    record_message.to_dict(),
+                    default=_orjson_default,
+                    option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_APPEND_NEWLINE,
+                )
+            except orjson.JSONEncodeError:
+                singer.write_message(record_message)
+            else:
+                _write_message_line(line)
+
+        self._is_state_flushed = False
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
 from typing import Any, Iterable, Optional
 
 import requests
 from singer_sdk import typing as th  # JSON Schema typing helpers
+from singer_sdk.exceptions import FatalAPIError
 
-from tap_netsuite.client import NetsuiteStream
+from tap_netsuite.client import MAX_POOL_CONNECTIONS, NetsuiteStream
+
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    from cached_property import cached_property
+
+# Number of parent records whose details are fetched concurrently per batch.
+DETAIL_BATCH_SIZE = 64
+# Largest page the record service and SuiteQL list endpoints accept.
+MAX_PAGE_SIZE = 1000
 
 
 links_schema = th.ArrayType(
@@ -17,21 +32,89 @@ links_schema = th.ArrayType(
     ),
 )
 
+ref_schema = th.ObjectType(
+    th.Property("id", th.StringType),
+    th.Property("refName", th.StringType),
+)
+
+ref_with_links_schema = th.ObjectType(
+    th.Property("links", links_schema),
+    th.Property("id", th.StringType),
+    th.Property("refName", th.StringType),
+)
+
 
 class NetsuiteRESTBaseStream(NetsuiteStream):
     primary_keys = ["id"]
     replication_key = None
-    records_jsonpath = "$.items[*]"
+    substream: type[NetsuiteStream] | None = None
     schema = th.PropertiesList(
         th.Property("id", th.IntegerType),
         th.Property("links", links_schema),
     ).to_dict()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that a stream's substream reads the same record type.
+
+        Args:
+            **kwargs: Keyword arguments passed on to `type.__init_subclass__`.
+
+        Raises:
+            TypeError: If the substream path targets a different record type.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.substream is not None:
+            record_type = cls.path.split("/")[1]
+            if cls.substream.path.split("/")[1] != record_type:
+                raise TypeError(
+                    f"{cls.__name__}.substream must read '{record_type}' records, "
+                    f"got '{cls.substream.path}'."
+                )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream and its per-context query cache.
+
+        Args:
+            *args: Arguments passed on to `NetsuiteStream`.
+            **kwargs: Keyword arguments passed on to `NetsuiteStream`.
+        """
+        super().__init__(*args, **kwargs)
+        self._replication_queries: dict = {}
+
     def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
         return {
             "id": record["id"]
         }
 
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+
+        Yields:
+            One item for every item found in the response.
+        """
+        yield from self._decode_response(response).get("items", ())
+
+    def validate_response(self, response: requests.Response) -> None:
+        """Validate HTTP response, treating a rejected list request as fatal.
+
+        Only record detail requests read a 400 as "record not found". On list
+        and query endpoints it means the request itself was rejected, e.g. an
+        invalid filter or page size, and must not end the sync as empty.
+
+        Args:
+            response: A `requests.Response` object.
+
+        Raises:
+            FatalAPIError: If the request was rejected.
+        """
+        if response.status_code == 400:
+            msg = self.response_error_message(response)
+            raise FatalAPIError(msg)
+        super().validate_response(response)
+
     def get_next_page_token(
         self,
         response: requests.Response,
@@ -46,11 +129,10 @@ class NetsuiteRESTBaseStream(NetsuiteStream):
         Returns:
             The next pagination token.
         """
-        response_json = response.json()
-        next_page_token = None
-        if response_json['hasMore']:
-            next_page_token = response_json['offset'] + response_json['count']
-        return next_page_token
+        response_json = self._decode_response(response)
+        if not response_json.get("hasMore") or not response_json.get("count"):
+            return None
+        return response_json["offset"] + response_json["count"]
 
     def get_url_params(
         self,
@@ -67,37 +149,233 @@ class NetsuiteRESTBaseStream(NetsuiteStream):
             A dictionary of URL query parameters.
         """
         params: dict = {
-            "limit": 1000
+            "limit": self.page_size
         }
-        if self.replication_key:
-            start_date = self.get_starting_timestamp(context)
-            start_date_formatted = start_date.strftime("%d/%m/%Y")
-            params['q'] = f'{self.replication_key} AFTER "{start_date_formatted}"'
+        query = self.get_replication_query(context)
+        if query:
+            params['q'] = query
         if next_page_token:
             params["offset"] = next_page_token
         return params
 
+    @property
+    def page_size(self) -> int:
+        """Return the configured page size, clamped to what Netsuite accepts.
+
+        Returns:
+            The number of records to request per page, from 1 to 1000.
+        """
+        page_size = self.config.get("page_size")
+        if page_size is None:
+            return MAX_PAGE_SIZE
+        return min(max(page_size, 1), MAX_PAGE_SIZE)
+
+    @property
+    def max_parallel_requests(self) -> int:
+        """Return the configured number of concurrent detail requests.
+
+        More workers than the shared connection pool holds would only open
+        extra connections, so the setting is capped at its size.
+
+        Returns:
+            The number of worker threads, from 1 to 32.
+        """
+        max_parallel_requests = self.config.get("max_parallel_requests")
+        if max_parallel_requests is None:
+            return 8
+        return min(max(max_parallel_requests, 1), MAX_POOL_CONNECTIONS)
+
+    @cached_property
+    def selected_fields(self) -> list[str] | None:
+        """Return the selected top-level fields, for detail requests to project.
+
+        Custom fields can't be listed up front, so selecting the custom field
+        group requests every field.
+
+        Returns:
+            The selected field names, or None if every field should be requested.
+        """
+        properties = [name for name in self.schema["properties"] if name != "links"]
+        selected = [name for name in properties if self.mask[("properties", name)]]
+        if len(selected) == len(properties):
+            return None
+        if self.substream and self.substream.custom_attribute_prefix in selected:
+            return None
+        return selected
+
+    def get_replication_query(self, context: dict | None) -> str | None:
+        """Return the `q` filter selecting records modified since the bookmark.
+
+        The filter is built once per context, so every page of a sync is
+        requested with the same start date.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The query string for the `q` URL parameter, or None to request every
+            record when there is no replication key, bookmark or `start_date`.
+        """
+        if not self.replication_key:
+            return None
+        key = tuple(sorted((context or {}).items()))
+        if key not in self._replication_queries:
+            start_date = self.get_starting_timestamp(context)
+            self._replication_queries[key] = (
+                None if start_date is None else self.build_replication_query(start_date)
+            )
+        return self._replication_queries[key]
+
+    def build_replication_query(self, start_date: datetime) -> str:
+        """Return a filter selecting records modified since `start_date`.
+
+        Args:
+            start_date: The starting timestamp of the sync.
+
+        Returns:
+            A record service query.
+        """
+        start_date_formatted = start_date.strftime("%d/%m/%Y")
+        return f'{self.replication_key} AFTER "{start_date_formatted}"'
+
     def get_records(self, context: dict | None) -> Iterable[dict[str, Any]]:
         """Return a generator of record-type dictionary objects.
 
         Each record emitted should be a dictionary of property names to their values.
 
+        Detail records for a batch of parent records are requested concurrently,
+        and yielded in the order of their parent records. Parent records listed
+        more than once are fetched once. Streams without a substream yield the
+        listed records themselves.
+
         Args:
             context: Stream partition or context dictionary.
 
         Yields:
             One item per (possibly processed) record in the API.
         """
-        for record in self.request_records(context):
-            context = context or {}
-            context["id"] = record["id"]
-            substream = self.substream(self._tap)
-            for sub_record in substream.request_records(context):
-                transformed_record = substream.post_process(sub_record, context)
-                if transformed_record is None:
-                    # Record filtered out during post_process()
-                    continue
-                yield transformed_record
+        if self.substream is None:
+            yield from super().get_records(context)
+            return
+        substream = self.substream(self._tap)
+        substream.fields = self.selected_fields
+        request_records = substream.request_records
+        post_process = substream.post_process
+        base_context = dict(context or {})
+        seen_ids: set = set()
+        parent_records = iter(self.request_records(context))
+        max_workers = self.max_parallel_requests
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                batch = list(islice(parent_records, DETAIL_BATCH_SIZE))
+                if not batch:
+                    break
+                sub_contexts = []
+                for record in batch:
+                    # Offset pages can shift while syncing; fetch each record once.
+                    if record["id"] in seen_ids:
+                        continue
+                    seen_ids.add(record["id"])
+                    sub_contexts.append({**base_context, "id": record["id"]})
+                sub_results = executor.map(
+                    lambda sub_context: list(request_records(sub_context)),
+                    sub_contexts,
+                )
+                for sub_context, sub_records in zip(sub_contexts, sub_results):
+                    for sub_record in sub_records:
+                        transformed_record = post_process(sub_record, sub_context)
+                        if transformed_record is None:
+                            # Record filtered out during post_process()
+                            continue
+                        yield transformed_record
+
+
+class NetsuiteSuiteQLStream(NetsuiteRESTBaseStream):
+    """Stream reading whole records in pages through a SuiteQL query.
+
+    Unlike the record service streams this needs a single request per page,
+    rather than one more request per record.
+    """
+
+    rest_method = "POST"
+    path = "/suiteql"
+    query: str = ""
+
+    @property
+    def url_base(self) -> str:
+        """Return the SuiteQL API URL root."""
+        return (
+            "https://{account_identifier}.suitetalk.api.netsuite.com"
+            "/services/rest/query/v1"
+        ).format(account_identifier=self.config["account_identifier"])
+
+    @cached_property
+    def http_headers(self) -> dict:
+        """Return the http headers needed, built once per stream.
+
+        Returns:
+            A dictionary of HTTP headers.
+        """
+        return {
+            **super().http_headers,
+            "Content-Type": "application/json",
+            "Prefer": "transient",
+        }
+
+    def get_url_params(
+        self,
+        context: dict | None,
+        next_page_token: Any | None,
+    ) -> dict[str, Any]:
+        """Return a dictionary of values to be used in URL parameterization.
+
+        The replication filter is sent in the query body instead.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page index or value.
+
+        Returns:
+            A dictionary of URL query parameters.
+        """
+        params = super().get_url_params(context, next_page_token)
+        params.pop("q", None)
+        return params
+
+    def build_replication_query(self, start_date: datetime) -> str:
+        """Return a SuiteQL condition selecting records modified since `start_date`.
+
+        Args:
+            start_date: The starting timestamp of the sync.
+
+        Returns:
+            A SuiteQL ``WHERE`` condition.
+        """
+        start_date_formatted = start_date.strftime("%Y-%m-%d")
+        return (
+            f"{self.replication_key} >= "
+            f"TO_DATE('{start_date_formatted}', 'YYYY-MM-DD')"
+        )
+
+    def prepare_request_payload(
+        self,
+        context: dict | None,
+        next_page_token: Any | None,
+    ) -> dict | None:
+        """Prepare the SuiteQL query sent as the request body.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page index or value.
+
+        Returns:
+            A dictionary with the SuiteQL query.
+        """
+        query = self.query
+        condition = self.get_replication_query(context)
+        if condition:
+            query += f" WHERE {condition}"
+        return {"q": f"{query} ORDER BY id"}
 
 
 customers_schema = th.PropertiesList(
@@ -113,10 +391,7 @@ customers_schema = th.PropertiesList(
                     th.Property("addressee", th.StringType),
                     th.Property("addrText", th.StringType),
                     th.Property("city", th.StringType),
-                    th.Property("country", th.ObjectType(
-                        th.Property("id", th.StringType),
-                        th.Property("refName", th.StringType),
-                    )),
+                    th.Property("country", ref_schema),
                     th.Property("override", th.BooleanType),
                     th.Property("zip", th.StringType),
                 )),
@@ -132,10 +407,7 @@ customers_schema = th.PropertiesList(
         )),
         th.Property("totalResults", th.IntegerType),
     )),
-    th.Property("alcoholRecipientType", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("alcoholRecipientType", ref_schema),
     th.Property("balance", th.NumberType),
     th.Property("companyName", th.StringType),
     th.Property("contactList", th.ObjectType(
@@ -155,57 +427,33 @@ customers_schema = th.PropertiesList(
         )),
         th.Property("totalResults", th.IntegerType),
     )),
-    th.Property("creditHoldOverride", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("currency", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("creditHoldOverride", ref_schema),
+    th.Property("currency", ref_with_links_schema),
     th.Property("currencyList", th.ObjectType(
         th.Property("links", links_schema),
         th.Property("items", th.ArrayType(
             th.ObjectType(
                 th.Property("links", links_schema),
                 th.Property("balance", th.NumberType),
-                th.Property("currency", th.ObjectType(
-                    th.Property("links", links_schema),
-                    th.Property("id", th.StringType),
-                    th.Property("refName", th.StringType),
-                )),
+                th.Property("currency", ref_with_links_schema),
                 th.Property("depositBalance", th.NumberType),
                 th.Property("displaySymbol", th.StringType),
                 th.Property("overdueBalance", th.NumberType),
                 th.Property("overrideCurrencyFormat", th.BooleanType),
-                th.Property("symbolPlacement", th.ObjectType(
-                    th.Property("id", th.StringType),
-                    th.Property("refName", th.StringType),
-                )),
+                th.Property("symbolPlacement", ref_schema),
                 th.Property("unbilledOrders", th.NumberType),
             ),
         )),
         th.Property("totalResults", th.IntegerType),
     )),
-    th.Property("customForm", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("customForm", ref_schema),
     th.Property("dateCreated", th.DateTimeType),
     th.Property("defaultAddress", th.StringType),
     th.Property("depositBalance", th.NumberType),
-    th.Property("emailPreference", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("emailPreference", ref_schema),
     th.Property("emailTransactions", th.BooleanType),
     th.Property("entityId", th.StringType),
-    th.Property("entityStatus", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("entityStatus", ref_with_links_schema),
     th.Property("faxTransactions", th.BooleanType),
     th.Property("giveAccess", th.BooleanType),
     th.Property("groupPricing", th.ObjectType(
@@ -228,33 +476,15 @@ customers_schema = th.PropertiesList(
         th.Property("totalResults", th.IntegerType),
     )),
     th.Property("lastModifiedDate", th.DateTimeType),
-    th.Property("numberFormat", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("numberFormat", ref_schema),
     th.Property("overdueBalance", th.NumberType),
     th.Property("printTransactions", th.BooleanType),
-    th.Property("receivablesAccount", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("receivablesAccount", ref_with_links_schema),
     th.Property("sendEmail", th.BooleanType),
     th.Property("shipComplete", th.BooleanType),
-    th.Property("shippingCarrier", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("subsidiary", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("terms", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("shippingCarrier", ref_schema),
+    th.Property("subsidiary", ref_with_links_schema),
+    th.Property("terms", ref_with_links_schema),
     th.Property("unbilledOrders", th.NumberType),
     th.Property("url", th.StringType),
     th.Property("custentity", th.ArrayType(th.ObjectType())),
@@ -279,68 +509,51 @@ class CustomersStream(NetsuiteRESTBaseStream):
     schema = customers_schema
 
 
+customers_suiteql_schema = th.PropertiesList(
+    th.Property("links", links_schema),
+    th.Property("id", th.StringType),
+    th.Property("companyname", th.StringType),
+    th.Property("datecreated", th.DateTimeType),
+    th.Property("entityid", th.StringType),
+    th.Property("isinactive", th.StringType),
+    th.Property("isperson", th.StringType),
+    th.Property("lastmodifieddate", th.DateTimeType),
+).to_dict()
+
+
+class CustomersSuiteQLStream(NetsuiteSuiteQLStream):
+    name = "customers_suiteql"
+    primary_keys = ["id"]
+    replication_key = "lastmodifieddate"
+    query = (
+        "SELECT id, companyName, "
+        "TO_CHAR(dateCreated, 'YYYY-MM-DD\"T\"HH24:MI:SS') AS dateCreated, "
+        "entityId, isInactive, isPerson, "
+        "TO_CHAR(lastModifiedDate, 'YYYY-MM-DD\"T\"HH24:MI:SS') AS lastModifiedDate "
+        "FROM customer"
+    )
+    schema = customers_suiteql_schema
+
+
 inventory_items_schema = th.PropertiesList(
     th.Property("links", links_schema),
-    th.Property("assetAccount", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("atpMethod", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("assetAccount", ref_with_links_schema),
+    th.Property("atpMethod", ref_schema),
     th.Property("autoLeadTime", th.BooleanType),
     th.Property("autoPreferredStockLevel", th.BooleanType),
     th.Property("autoReorderPoint", th.BooleanType),
     th.Property("averageCost", th.NumberType),
-    th.Property("billExchRateVarianceAcct", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("class", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("cogsAccount", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("costEstimateType", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("costingMethod", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("countryOfManufacture", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("billExchRateVarianceAcct", ref_with_links_schema),
+    th.Property("class", ref_with_links_schema),
+    th.Property("cogsAccount", ref_with_links_schema),
+    th.Property("costEstimateType", ref_schema),
+    th.Property("costingMethod", ref_schema),
+    th.Property("countryOfManufacture", ref_schema),
     th.Property("createdDate", th.DateTimeType),
-    th.Property("createRevenuePlansOn", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("currency", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("customForm", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("deferredRevenueAccount", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("createRevenuePlansOn", ref_with_links_schema),
+    th.Property("currency", ref_with_links_schema),
+    th.Property("customForm", ref_schema),
+    th.Property("deferredRevenueAccount", ref_with_links_schema),
     th.Property("deferRevRec", th.BooleanType),
     th.Property("directRevenuePosting", th.BooleanType),
     th.Property("displayName", th.StringType),
@@ -349,33 +562,18 @@ inventory_items_schema = th.PropertiesList(
     th.Property("excludeFromSiteMap", th.BooleanType),
     th.Property("externalId", th.StringType),
     th.Property("froogleProductFeed", th.BooleanType),
-    th.Property("gainLossAccount", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("gainLossAccount", ref_with_links_schema),
     th.Property("id", th.StringType),
     th.Property("includeChildren", th.BooleanType),
-    th.Property("incomeAccount", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("intercoIncomeAccount", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("incomeAccount", ref_with_links_schema),
+    th.Property("intercoIncomeAccount", ref_with_links_schema),
     th.Property("internalId", th.IntegerType),
     th.Property("isGCoCompliant", th.BooleanType),
     th.Property("isInactive", th.BooleanType),
     th.Property("isLotItem", th.BooleanType),
     th.Property("isOnline", th.BooleanType),
     th.Property("itemId", th.StringType),
-    th.Property("itemType", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("itemType", ref_schema),
     th.Property("itemVendor", th.ObjectType(
         th.Property("links", links_schema),
     )),
@@ -391,16 +589,8 @@ inventory_items_schema = th.PropertiesList(
         th.Property("links", links_schema),
     )),
     th.Property("purchaseDescription", th.StringType),
-    th.Property("revenueRecognitionRule", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("revRecForecastRule", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("revenueRecognitionRule", ref_with_links_schema),
+    th.Property("revRecForecastRule", ref_with_links_schema),
     th.Property("roundUpAsComponent", th.BooleanType),
     th.Property("salesDescription", th.StringType),
     th.Property("seasonalDemand", th.BooleanType),
@@ -412,24 +602,15 @@ inventory_items_schema = th.PropertiesList(
     th.Property("subsidiary", th.ObjectType(
         th.Property("links", links_schema),
     )),
-    th.Property("supplyReplenishmentMethod", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("supplyReplenishmentMethod", ref_schema),
     th.Property("totalValue", th.NumberType),
     th.Property("trackLandedCost", th.BooleanType),
     th.Property("upcCode", th.StringType),
     th.Property("vendorName", th.StringType),
     th.Property("VSOEDelivered", th.BooleanType),
-    th.Property("VSOESopGroup", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("VSOESopGroup", ref_schema),
     th.Property("weight", th.NumberType),
-    th.Property("weightUnit", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("weightUnit", ref_schema),
     th.Property("yahooProductFeed", th.BooleanType),
     th.Property("custitem", th.ArrayType(th.ObjectType())),
 ).to_dict()
@@ -455,48 +636,22 @@ class InventoryItemsStream(NetsuiteRESTBaseStream):
 
 purchase_orders_schema = th.PropertiesList(
     th.Property("links", links_schema),
-    th.Property("approvalStatus", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("approvalStatus", ref_schema),
     th.Property("balance", th.NumberType),
     th.Property("billAddress", th.StringType),
-    th.Property("billAddressList", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("billAddressList", ref_with_links_schema),
     th.Property("billingAddress", th.ObjectType(
         th.Property("links", links_schema),
     )),
     th.Property("billingAddress_text", th.StringType),
     th.Property("createdDate", th.DateTimeType),
-    th.Property("currency", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("customForm", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("department", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("currency", ref_with_links_schema),
+    th.Property("customForm", ref_schema),
+    th.Property("department", ref_with_links_schema),
     th.Property("dueDate", th.DateTimeType),
     th.Property("email", th.StringType),
-    th.Property("employee", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("entity", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("employee", ref_with_links_schema),
+    th.Property("entity", ref_with_links_schema),
     th.Property("exchangeRate", th.NumberType),
     th.Property("expense", th.ObjectType(
         th.Property("links", links_schema),
@@ -507,28 +662,13 @@ purchase_orders_schema = th.PropertiesList(
         th.Property("links", links_schema),
     )),
     th.Property("lastModifiedDate", th.DateTimeType),
-    th.Property("location", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("location", ref_with_links_schema),
     th.Property("memo", th.StringType),
-    th.Property("nextApprover", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("orderStatus", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("nextApprover", ref_with_links_schema),
+    th.Property("orderStatus", ref_schema),
     th.Property("prevDate", th.DateTimeType),
     th.Property("shipAddress", th.StringType),
-    th.Property("shipAddressList", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("shipAddressList", ref_with_links_schema),
     th.Property("shipDate", th.DateTimeType),
     th.Property("shipIsResidential", th.BooleanType),
     th.Property("shipOverride", th.BooleanType),
@@ -536,21 +676,10 @@ purchase_orders_schema = th.PropertiesList(
         th.Property("links", links_schema),
     )),
     th.Property("shippingAddress_text", th.StringType),
-    th.Property("status", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("subsidiary", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("status", ref_schema),
+    th.Property("subsidiary", ref_with_links_schema),
     th.Property("subtotal", th.NumberType),
-    th.Property("terms", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("terms", ref_with_links_schema),
     th.Property("toBeEmailed", th.BooleanType),
     th.Property("toBeFaxed", th.BooleanType),
     th.Property("toBePrinted", th.BooleanType),
@@ -583,37 +712,18 @@ class PurchaseOrdersStream(NetsuiteRESTBaseStream):
 sales_orders_schema = th.PropertiesList(
     th.Property("links", links_schema),
     th.Property("billAddress", th.StringType),
-    th.Property("billAddressList", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("billAddressList", ref_with_links_schema),
     th.Property("billingAddress", th.ObjectType(
         th.Property("links", links_schema),
     )),
     th.Property("billingAddress_text", th.StringType),
     th.Property("canBeUnapproved", th.BooleanType),
     th.Property("createdDate", th.DateTimeType),
-    th.Property("currency", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("customForm", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
-    th.Property("department", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("currency", ref_with_links_schema),
+    th.Property("customForm", ref_schema),
+    th.Property("department", ref_with_links_schema),
     th.Property("email", th.StringType),
-    th.Property("entity", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("entity", ref_with_links_schema),
     th.Property("estGrossProfit", th.NumberType),
     th.Property("exchangeRate", th.NumberType),
     th.Property("id", th.StringType),
@@ -622,26 +732,15 @@ sales_orders_schema = th.PropertiesList(
         th.Property("links", links_schema),
     )),
     th.Property("lastModifiedDate", th.DateTimeType),
-    th.Property("location", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("location", ref_with_links_schema),
     th.Property("memo", th.StringType),
     th.Property("needsPick", th.BooleanType),
     th.Property("nextBill", th.DateTimeType),
-    th.Property("orderStatus", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("orderStatus", ref_schema),
     th.Property("prevDate", th.DateTimeType),
     th.Property("salesEffectiveDate", th.DateTimeType),
     th.Property("shipAddress", th.StringType),
-    th.Property("shipAddressList", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("shipAddressList", ref_with_links_schema),
     th.Property("shipComplete", th.BooleanType),
     th.Property("shipDate", th.DateTimeType),
     th.Property("shipIsResidential", th.BooleanType),
@@ -650,16 +749,9 @@ sales_orders_schema = th.PropertiesList(
         th.Property("links", links_schema),
     )),
     th.Property("shippingAddress_text", th.StringType),
-    th.Property("status", th.ObjectType(
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("status", ref_schema),
     th.Property("storeOrder", th.StringType),
-    th.Property("subsidiary", th.ObjectType(
-        th.Property("links", links_schema),
-        th.Property("id", th.StringType),
-        th.Property("refName", th.StringType),
-    )),
+    th.Property("subsidiary", ref_with_links_schema),
     th.Property("subtotal", th.NumberType),
     th.Property("toBeEmailed", th.BooleanType),
     th.Property("toBeFaxed", th.BooleanType),
@@ -689,3 +781,12 @@ class SalesOrdersStream(NetsuiteRESTBaseStream):
     replication_key = "lastModifiedDate"
     substream = SalesOrdersSubStream
     schema = sales_orders_schema
+
+
+STREAM_TYPES = (
+    CustomersStream,
+    CustomersSuiteQLStream,
+    InventoryItemsStream,
+    PurchaseOrdersStream,
+    SalesOrdersStream,
+)
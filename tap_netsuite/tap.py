@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
 
-from tap_netsuite import streams
+if TYPE_CHECKING:
+    from tap_netsuite.client import NetsuiteStream
 
 
 class TapNetsuite(Tap):
@@ -47,20 +50,49 @@ class TapNetsuite(Tap):
             th.DateTimeType,
             description="The earliest record date to sync",
         ),
+        th.Property(
+            "cache_access_token",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Cache OAuth access tokens on disk, in the user's cache directory, "
+                "to reuse them across runs"
+            ),
+        ),
+        th.Property(
+            "user_agent",
+            th.StringType,
+            description="User-Agent header sent with every API request",
+        ),
+        th.Property(
+            "page_size",
+            th.IntegerType,
+            default=1000,
+            description="Number of records requested per page, from 1 to 1000",
+        ),
+        th.Property(
+            "max_parallel_requests",
+            th.IntegerType,
+            default=8,
+            description=(
+                "Maximum number of record detail requests to run concurrently, "
+                "from 1 to 32"
+            ),
+        ),
     ).to_dict()
 
-    def discover_streams(self) -> list[streams.NetsuiteStream]:
+    def discover_streams(self) -> list[NetsuiteStream]:
         """Return a list of discovered streams.
 
+        Stream modules are imported here so that CLI calls which never build
+        streams, such as `--help` and `--about`, skip loading them.
+
         Returns:
             A list of discovered streams.
         """
-        return [
-            streams.CustomersStream(self),
-            streams.InventoryItemsStream(self),
-            streams.PurchaseOrdersStream(self),
-            streams.SalesOrdersStream(self)
-        ]
+        from tap_netsuite import streams
+
+        return [stream_class(self) for stream_class in streams.STREAM_TYPES]
 
 
 if __name__ == "__main__":
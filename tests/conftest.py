@@ -1,3 +1,99 @@
 """Test Configuration."""
 
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from tap_netsuite import client
+from tap_netsuite.auth import NetsuiteAuthenticator
+from tap_netsuite.client import NetsuiteStream
+from tap_netsuite.tap import TapNetsuite
+
 pytest_plugins = ("singer_sdk.testing.pytest_plugin",)
+
+SAMPLE_CONFIG = {
+    "client_id": "client-id",
+    "client_secret": "client-secret",
+    "refresh_token": "refresh-token",
+    "account_identifier": "acct",
+    "start_date": "2020-01-01T00:00:00Z",
+}
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter answering requests from a handler, without a network.
+
+    The handler returns a ``(status, body)`` or ``(status, body, headers)``
+    tuple for each request. Requests are recorded in the order they were sent.
+    """
+
+    def __init__(self, handler: Callable[[requests.PreparedRequest], tuple]) -> None:
+        super().__init__()
+        self.handler = handler
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        self.requests.append(request)
+        status, body, *headers = self.handler(request)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        if headers:
+            response.headers.update(headers[0])
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Reset the state Netsuite streams share across instances."""
+    NetsuiteStream._shared_authenticator = None
+    NetsuiteStream._rate_limited_until = 0.0
+    NetsuiteAuthenticator._SingletonMeta__single_instance = None
+    yield
+    NetsuiteStream._shared_authenticator = None
+    NetsuiteStream._rate_limited_until = 0.0
+    NetsuiteAuthenticator._SingletonMeta__single_instance = None
+
+
+@pytest.fixture
+def fake_transport(monkeypatch):
+    """Return a function routing stream requests to a `FakeAdapter`."""
+
+    def install(handler: Callable[[requests.PreparedRequest], tuple]) -> FakeAdapter:
+        adapter = FakeAdapter(handler)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        monkeypatch.setattr(client, "_HTTP_SESSION", session)
+        return adapter
+
+    return install
+
+
+@pytest.fixture
+def make_tap(monkeypatch):
+    """Return a function building taps whose streams skip the token request."""
+    monkeypatch.setattr(NetsuiteAuthenticator, "is_token_valid", lambda self: True)
+
+    def build(**config: Any) -> TapNetsuite:
+        return TapNetsuite(config={**SAMPLE_CONFIG, **config}, parse_env_config=False)
+
+    return build
+
+
+@pytest.fixture
+def tap(make_tap):
+    """Return a tap built from the sample config."""
+    return make_tap()
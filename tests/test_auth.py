@@ -0,0 +1,270 @@
+"""Tests for the Netsuite OAuth authenticator and its token cache."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from types import SimpleNamespace
+
+import backoff
+import pytest
+import requests
+from singer_sdk.exceptions import FatalAPIError
+from singer_sdk.helpers._util import utc_now
+
+from tap_netsuite import auth
+from tap_netsuite.auth import NetsuiteAuthenticator
+from tap_netsuite.streams import CustomersSuiteQLStream
+from tap_netsuite.tap import TapNetsuite
+
+from .conftest import SAMPLE_CONFIG, FakeAdapter
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep token caches in a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+def make_authenticator(**config) -> NetsuiteAuthenticator:
+    """Return a new authenticator, bypassing the shared singleton."""
+    NetsuiteAuthenticator._SingletonMeta__single_instance = None
+    stream = SimpleNamespace(
+        tap_name="tap-netsuite",
+        config={**SAMPLE_CONFIG, "cache_access_token": True, **config},
+        logger=logging.getLogger("tap-netsuite"),
+    )
+    return NetsuiteAuthenticator(stream=stream)
+
+
+def store_token(authenticator, expires_in=3600, age=0) -> None:
+    authenticator.access_token = "cached-token"
+    authenticator.expires_in = expires_in
+    authenticator.last_refreshed = utc_now() - timedelta(seconds=age)
+    authenticator._store_cached_token()
+
+
+def test_cached_token_is_reused():
+    store_token(make_authenticator())
+
+    authenticator = make_authenticator()
+
+    assert authenticator.is_token_valid()
+    assert authenticator.access_token == "cached-token"
+
+
+def test_cache_is_private_to_the_user(cache_home):
+    authenticator = make_authenticator()
+    store_token(authenticator)
+
+    path = authenticator.token_cache_path
+    assert path.parent == cache_home / "tap-netsuite"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_nearly_expired_token_is_not_reused():
+    store_token(make_authenticator(), age=3400)
+
+    assert not make_authenticator().is_token_valid()
+
+
+def test_cached_lifetime_is_capped():
+    store_token(make_authenticator(), expires_in=10**9, age=2 * 3600)
+
+    assert not make_authenticator().is_token_valid()
+
+
+def test_token_from_the_future_is_not_reused():
+    store_token(make_authenticator(), age=-600)
+
+    assert not make_authenticator().is_token_valid()
+
+
+def test_corrupt_cache_is_ignored():
+    authenticator = make_authenticator()
+    authenticator.token_cache_path.parent.mkdir(parents=True)
+    authenticator.token_cache_path.write_text("{not json")
+
+    assert not authenticator.is_token_valid()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX file owners")
+def test_cache_owned_by_another_user_is_ignored(monkeypatch):
+    store_token(make_authenticator())
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+    assert not make_authenticator().is_token_valid()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"refresh_token": "other-refresh-token"},
+        {"client_secret": "other-client-secret"},
+        {"client_id": "other-client-id"},
+        {"account_identifier": "other"},
+    ],
+)
+def test_other_credentials_do_not_reuse_the_token(config):
+    store_token(make_authenticator())
+
+    authenticator = make_authenticator(**config)
+
+    assert not authenticator.is_token_valid()
+    assert authenticator.token_cache_path != make_authenticator().token_cache_path
+
+
+def test_cache_key_separates_fields():
+    first = make_authenticator(client_id="ab", account_identifier="c")
+    second = make_authenticator(client_id="a", account_identifier="bc")
+
+    assert first.token_cache_path != second.token_cache_path
+
+
+def test_clear_cached_token():
+    authenticator = make_authenticator()
+    store_token(authenticator)
+
+    authenticator.clear_cached_token()
+
+    assert not authenticator.token_cache_path.exists()
+    assert not authenticator.is_token_valid()
+
+
+def test_unauthorized_response_clears_the_cache(tap, fake_transport):
+    stream = CustomersSuiteQLStream(tap)
+    store_token(stream.authenticator)
+    fake_transport(lambda request: (401, {"o:errorDetails": []}))
+
+    with pytest.raises(FatalAPIError):
+        stream.sync()
+
+    assert not stream.authenticator.token_cache_path.exists()
+
+
+@pytest.fixture
+def token_endpoint(monkeypatch):
+    """Route token requests to a fake adapter, retrying without waiting."""
+    monkeypatch.setattr(
+        NetsuiteAuthenticator, "_token_retry_delay", staticmethod(lambda *args: 0)
+    )
+
+    def install(handler) -> FakeAdapter:
+        adapter = FakeAdapter(handler)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        monkeypatch.setattr(NetsuiteAuthenticator, "_session", session)
+        return adapter
+
+    return install
+
+
+def test_token_request_is_retried(token_endpoint):
+    responses = iter(
+        [(503, {}), (200, {"access_token": "new-token", "expires_in": 3600})]
+    )
+    adapter = token_endpoint(lambda request: next(responses))
+    authenticator = make_authenticator()
+
+    authenticator.update_access_token()
+
+    assert len(adapter.requests) == 2
+    assert authenticator.access_token == "new-token"
+    assert make_authenticator().is_token_valid()
+
+
+def test_token_request_gives_up(token_endpoint):
+    adapter = token_endpoint(lambda request: (503, {"error": "unavailable"}))
+
+    with pytest.raises(RuntimeError):
+        make_authenticator().update_access_token()
+
+    assert len(adapter.requests) == auth.TOKEN_MAX_ATTEMPTS
+
+
+def test_token_is_refreshed_once_across_threads(token_endpoint):
+    def handler(request):
+        time.sleep(0.05)
+        return 200, {"access_token": "new-token", "expires_in": 3600}
+
+    adapter = token_endpoint(handler)
+    authenticator = make_authenticator()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        headers = list(executor.map(lambda _: authenticator.auth_headers, range(8)))
+
+    assert len(adapter.requests) == 1
+    assert {header["Authorization"] for header in headers} == {"Bearer new-token"}
+
+
+def test_cache_is_off_by_default(token_endpoint):
+    token_endpoint(
+        lambda request: (200, {"access_token": "new-token", "expires_in": 3600})
+    )
+    store_token(make_authenticator())
+    authenticator = make_authenticator(cache_access_token=False)
+
+    assert not authenticator.is_token_valid()
+    authenticator.token_cache_path.unlink()
+    authenticator.update_access_token()
+
+    assert not authenticator.token_cache_path.exists()
+
+
+@pytest.fixture
+def cached_token_stream(token_endpoint):
+    """Return a SuiteQL stream whose first token comes from the cache."""
+    store_token(make_authenticator())
+    NetsuiteAuthenticator._SingletonMeta__single_instance = None
+    token_adapter = token_endpoint(
+        lambda request: (200, {"access_token": "new-token", "expires_in": 3600})
+    )
+    tap = TapNetsuite(
+        config={**SAMPLE_CONFIG, "cache_access_token": True},
+        parse_env_config=False,
+    )
+    stream = CustomersSuiteQLStream(tap)
+    stream.backoff_wait_generator = lambda: backoff.constant(interval=0)
+    stream.backoff_jitter = lambda value: 0
+    return stream, token_adapter
+
+
+def test_revoked_cached_token_is_replaced(cached_token_stream, fake_transport, capsys):
+    stream, token_adapter = cached_token_stream
+    record = {"id": "1", "lastmodifieddate": "2023-01-01T00:00:00"}
+    authorizations = []
+
+    def handler(request):
+        authorizations.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer cached-token":
+            return 401, {"o:errorDetails": []}
+        return 200, {"items": [record], "count": 1, "hasMore": False}
+
+    fake_transport(handler)
+
+    stream.sync()
+
+    assert authorizations == ["Bearer cached-token", "Bearer new-token"]
+    assert len(token_adapter.requests) == 1
+    assert '"record":{"id":"1"' in capsys.readouterr().out.replace(" ", "")
+    reloaded = make_authenticator()
+    assert reloaded.is_token_valid()
+    assert reloaded.access_token == "new-token"
+
+
+def test_rejected_new_token_is_not_retried(cached_token_stream, fake_transport):
+    stream, token_adapter = cached_token_stream
+    adapter = fake_transport(lambda request: (401, {"o:errorDetails": []}))
+
+    with pytest.raises(FatalAPIError):
+        stream.sync()
+
+    assert len(adapter.requests) == 2
+    assert len(token_adapter.requests) == 1
+    assert not make_authenticator().token_cache_path.exists()
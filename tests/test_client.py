@@ -0,0 +1,126 @@
+"""Tests for the shared Netsuite HTTP client behaviour."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import partial
+
+import backoff
+import pytest
+from singer_sdk._singerlib.messages import format_message
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_netsuite import client
+from tap_netsuite.client import NetsuiteStream
+from tap_netsuite.streams import CustomersSubStream, CustomersSuiteQLStream
+
+
+@pytest.fixture
+def stream(tap, monkeypatch):
+    """Return a stream retrying failed requests without waiting."""
+    stream = CustomersSuiteQLStream(tap)
+    monkeypatch.setattr(
+        stream, "backoff_wait_generator", lambda: backoff.constant(interval=0)
+    )
+    monkeypatch.setattr(stream, "backoff_jitter", lambda value: 0)
+    return stream
+
+
+def test_session_does_not_retry_on_its_own():
+    adapter = client._HTTP_SESSION.get_adapter("https://acct.example.com")
+
+    assert adapter.max_retries.total == 0
+
+
+def test_server_errors_are_retried_once_per_backoff_try(stream, fake_transport):
+    adapter = fake_transport(lambda request: (503, {}))
+
+    with pytest.raises(RetriableAPIError):
+        stream.sync()
+
+    assert len(adapter.requests) == stream.backoff_max_tries()
+
+
+@pytest.fixture
+def sub_stream(tap, monkeypatch):
+    """Return a record detail stream retrying failed requests without waiting."""
+    stream = CustomersSubStream(tap)
+    monkeypatch.setattr(
+        stream, "backoff_wait_generator", lambda: backoff.constant(interval=0)
+    )
+    monkeypatch.setattr(stream, "backoff_jitter", lambda value: 0)
+    return stream
+
+
+def test_throttled_retry_waits_for_retry_after(
+    sub_stream, fake_transport, monkeypatch
+):
+    responses = iter([(429, {}, {"Retry-After": "2"}), (200, {"id": "1"})])
+    adapter = fake_transport(lambda request: next(responses))
+    sleeps = []
+    monkeypatch.setattr(client.time, "sleep", sleeps.append)
+
+    records = list(sub_stream.request_records({"id": 1}))
+
+    assert records == [{"id": "1"}]
+    assert len(adapter.requests) == 2
+    assert [delay for delay in sleeps if delay] == [pytest.approx(2, abs=0.5)]
+    assert NetsuiteStream._rate_limited_until == 0.0
+
+
+def test_requests_go_out_one_at_a_time_while_throttled(sub_stream, fake_transport):
+    events = []
+    events_lock = threading.Lock()
+
+    def handler(request):
+        with events_lock:
+            events.append(("start", request.url))
+        time.sleep(0.05)
+        with events_lock:
+            events.append(("end", request.url))
+        return 200, {}
+
+    fake_transport(handler)
+    requests = [
+        sub_stream.prepare_request({"id": record_id}, None) for record_id in range(4)
+    ]
+    NetsuiteStream._rate_limited_until = time.monotonic() + 0.1
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda request: sub_stream._request(request, None), requests))
+
+    first_url = events[0][1]
+    assert events[:2] == [("start", first_url), ("end", first_url)]
+    assert NetsuiteStream._rate_limited_until == 0.0
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"id": "1", "companyname": "Acme", "isinactive": None},
+        {"id": "1", "entityid": 12.5},
+        {"id": "1", "entityid": Decimal("1.10")},
+        {"id": "1", "entityid": 2**70},
+        {"id": "1", "lastmodifieddate": datetime(2023, 1, 2, tzinfo=timezone.utc)},
+    ],
+)
+def test_record_messages_match_the_sdk(tap, capsys, record):
+    stream = CustomersSuiteQLStream(tap)
+    (expected_message,) = stream._generate_record_messages(record)
+    expected = format_message(expected_message)
+
+    stream._write_record_message(record)
+
+    written = capsys.readouterr().out.strip()
+    load = partial(json.loads, parse_float=Decimal)
+    assert {**load(written), "time_extracted": None} == {
+        **load(expected),
+        "time_extracted": None,
+    }
+    if "entityid" in record:
+        assert f'"entityid":{record["entityid"]}' in written.replace(" ", "")
@@ -0,0 +1,279 @@
+"""Tests for the Netsuite record service and SuiteQL streams."""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from singer_sdk.exceptions import FatalAPIError
+
+from tap_netsuite.streams import CustomersStream, CustomersSuiteQLStream
+from tap_netsuite.tap import TapNetsuite
+
+from .conftest import SAMPLE_CONFIG
+
+
+def list_page(ids: list[int], offset: int = 0, **extra) -> dict:
+    """Return a record service list page for the given record ids."""
+    page = {
+        "offset": offset,
+        "count": len(ids),
+        "items": [
+            {"id": str(record_id), "lastmodifieddate": "2023-01-01T00:00:00"}
+            for record_id in ids
+        ],
+    }
+    page.update(extra)
+    return page
+
+
+def detail_record(record_id: int) -> dict:
+    """Return a record as served by a detail endpoint."""
+    return {"id": str(record_id), "lastModifiedDate": "2023-01-01T00:00:00Z"}
+
+
+def sync_records(stream, capsys) -> list[dict]:
+    """Sync a stream and return the records it wrote."""
+    stream.sync()
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return [message["record"] for message in messages if message["type"] == "RECORD"]
+
+
+def detail_id(request) -> int | None:
+    """Return the record id requested from a detail endpoint, if any."""
+    match = re.search(r"/customer/(\d+)", request.url)
+    return int(match.group(1)) if match else None
+
+
+def test_list_400_fails_the_sync(tap, fake_transport, capsys):
+    fake_transport(lambda request: (400, {"o:errorDetails": [{"detail": "bad q"}]}))
+
+    with pytest.raises(FatalAPIError):
+        sync_records(CustomersStream(tap), capsys)
+
+
+def test_suiteql_400_fails_the_sync(tap, fake_transport, capsys):
+    fake_transport(lambda request: (400, {"o:errorDetails": [{"detail": "bad query"}]}))
+
+    with pytest.raises(FatalAPIError):
+        sync_records(CustomersSuiteQLStream(tap), capsys)
+
+
+def test_detail_400_skips_the_record(tap, fake_transport, capsys):
+    def handler(request):
+        record_id = detail_id(request)
+        if record_id is None:
+            return 200, list_page([1, 2, 3], hasMore=False)
+        if record_id == 2:
+            return 400, {"o:errorDetails": [{"detail": "not found"}]}
+        return 200, detail_record(record_id)
+
+    fake_transport(handler)
+
+    records = sync_records(CustomersStream(tap), capsys)
+
+    assert [record["id"] for record in records] == ["1", "3"]
+
+
+def test_pagination_stops_without_has_more(tap, fake_transport, capsys):
+    adapter = fake_transport(lambda request: (200, list_page([1, 2])))
+
+    records = sync_records(CustomersSuiteQLStream(tap), capsys)
+
+    assert [record["id"] for record in records] == ["1", "2"]
+    assert len(adapter.requests) == 1
+
+
+def test_pagination_stops_on_empty_page(tap, fake_transport, capsys):
+    adapter = fake_transport(lambda request: (200, list_page([], hasMore=True)))
+
+    assert sync_records(CustomersSuiteQLStream(tap), capsys) == []
+    assert len(adapter.requests) == 1
+
+
+def test_pagination_follows_offsets(tap, fake_transport, capsys):
+    def handler(request):
+        if "offset=2" in request.url:
+            return 200, list_page([3], offset=2, hasMore=False)
+        return 200, list_page([1, 2], hasMore=True)
+
+    adapter = fake_transport(handler)
+
+    records = sync_records(CustomersSuiteQLStream(tap), capsys)
+
+    assert [record["id"] for record in records] == ["1", "2", "3"]
+    assert len(adapter.requests) == 2
+
+
+@pytest.mark.parametrize(
+    "page_size,expected",
+    [(None, 1000), (0, 1), (-5, 1), (250, 250), (5000, 1000)],
+)
+def test_page_size_is_clamped(make_tap, page_size, expected):
+    stream = CustomersStream(make_tap(page_size=page_size))
+
+    assert stream.page_size == expected
+
+
+@pytest.mark.parametrize(
+    "max_parallel_requests,expected",
+    [(None, 8), (0, 1), (-1, 1), (4, 4), (32, 32), (100, 32)],
+)
+def test_max_parallel_requests_is_clamped(
+    make_tap, max_parallel_requests, expected
+):
+    stream = CustomersStream(make_tap(max_parallel_requests=max_parallel_requests))
+
+    assert stream.max_parallel_requests == expected
+
+
+def test_limit_is_sent_clamped(make_tap, fake_transport, capsys):
+    adapter = fake_transport(lambda request: (200, list_page([1], hasMore=False)))
+
+    sync_records(CustomersSuiteQLStream(make_tap(page_size=5000)), capsys)
+
+    assert "limit=1000" in adapter.requests[0].url
+
+
+def test_zero_max_parallel_requests_still_syncs(make_tap, fake_transport, capsys):
+    def handler(request):
+        record_id = detail_id(request)
+        if record_id is None:
+            return 200, list_page([1, 2], hasMore=False)
+        return 200, detail_record(record_id)
+
+    fake_transport(handler)
+
+    records = sync_records(CustomersStream(make_tap(max_parallel_requests=0)), capsys)
+
+    assert [record["id"] for record in records] == ["1", "2"]
+
+
+def test_details_are_yielded_in_parent_order(tap, fake_transport, capsys):
+    parent_ids = list(range(100, 30, -1))  # more than one DETAIL_BATCH_SIZE batch
+
+    def handler(request):
+        record_id = detail_id(request)
+        if record_id is None:
+            return 200, list_page(parent_ids, hasMore=False)
+        # Finish out of order: later parents answer first.
+        time.sleep(record_id % 3 / 1000)
+        return 200, detail_record(record_id)
+
+    fake_transport(handler)
+
+    records = sync_records(CustomersStream(tap), capsys)
+
+    assert [record["id"] for record in records] == [str(i) for i in parent_ids]
+
+
+def test_parents_listed_twice_are_fetched_once(tap, fake_transport, capsys):
+    def handler(request):
+        record_id = detail_id(request)
+        if record_id is not None:
+            return 200, detail_record(record_id)
+        if "offset=3" in request.url:
+            # A record moved between pages while paginating.
+            return 200, list_page([3, 4], offset=3, hasMore=False)
+        return 200, list_page([1, 2, 3], hasMore=True)
+
+    adapter = fake_transport(handler)
+
+    records = sync_records(CustomersStream(tap), capsys)
+
+    assert [record["id"] for record in records] == ["1", "2", "3", "4"]
+    detail_ids = [detail_id(request) for request in adapter.requests]
+    assert sorted(i for i in detail_ids if i is not None) == [1, 2, 3, 4]
+
+
+def test_detail_requests_project_selected_fields(tap, fake_transport, capsys):
+    def handler(request):
+        record_id = detail_id(request)
+        if record_id is None:
+            return 200, list_page([1], hasMore=False)
+        return 200, detail_record(record_id)
+
+    adapter = fake_transport(handler)
+    stream = CustomersStream(tap)
+    for name in stream.schema["properties"]:
+        if name not in ("id", "lastModifiedDate"):
+            stream.metadata[("properties", name)].selected = False
+
+    sync_records(stream, capsys)
+
+    fields = parse_qs(urlparse(adapter.requests[-1].url).query)["fields"]
+    assert fields == ["id,lastModifiedDate"]
+
+
+def test_selecting_custom_fields_requests_every_field(tap, fake_transport, capsys):
+    def handler(request):
+        record_id = detail_id(request)
+        if record_id is None:
+            return 200, list_page([1], hasMore=False)
+        return 200, detail_record(record_id)
+
+    adapter = fake_transport(handler)
+    stream = CustomersStream(tap)
+    stream.metadata[("properties", "companyName")].selected = False
+
+    sync_records(stream, capsys)
+
+    assert "fields" not in parse_qs(urlparse(adapter.requests[-1].url).query)
+
+
+def test_suiteql_request(make_tap, fake_transport, capsys):
+    adapter = fake_transport(lambda request: (200, list_page([1], hasMore=False)))
+
+    sync_records(CustomersSuiteQLStream(make_tap(user_agent="tap-test")), capsys)
+
+    request = adapter.requests[0]
+    assert request.method == "POST"
+    assert urlparse(request.url).path == "/services/rest/query/v1/suiteql"
+    assert "q" not in parse_qs(urlparse(request.url).query)
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["Prefer"] == "transient"
+    assert request.headers["User-Agent"] == "tap-test"
+    query = json.loads(request.body)["q"]
+    assert query.startswith(CustomersSuiteQLStream.query)
+    assert query.endswith(
+        " WHERE lastmodifieddate >= TO_DATE('2020-01-01', 'YYYY-MM-DD') ORDER BY id"
+    )
+
+
+@pytest.fixture
+def tap_without_start_date(make_tap):
+    """Return a tap configured with only the required settings."""
+    config = {key: value for key, value in SAMPLE_CONFIG.items() if key != "start_date"}
+    return TapNetsuite(config=config, parse_env_config=False)
+
+
+def test_suiteql_without_start_date_reads_every_record(
+    tap_without_start_date, fake_transport, capsys
+):
+    adapter = fake_transport(lambda request: (200, list_page([1], hasMore=False)))
+
+    records = sync_records(CustomersSuiteQLStream(tap_without_start_date), capsys)
+
+    assert [record["id"] for record in records] == ["1"]
+    query = json.loads(adapter.requests[0].body)["q"]
+    assert query == f"{CustomersSuiteQLStream.query} ORDER BY id"
+
+
+def test_list_without_start_date_sends_no_filter(
+    tap_without_start_date, fake_transport, capsys
+):
+    def handler(request):
+        record_id = detail_id(request)
+        if record_id is None:
+            return 200, list_page([1], hasMore=False)
+        return 200, detail_record(record_id)
+
+    adapter = fake_transport(handler)
+
+    records = sync_records(CustomersStream(tap_without_start_date), capsys)
+
+    assert [record["id"] for record in records] == ["1"]
+    assert "q" not in parse_qs(urlparse(adapter.requests[0].url).query)